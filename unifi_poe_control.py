@@ -15,9 +15,13 @@ Examples:
 
 import argparse
 import asyncio
+import json
 import logging
+import os
 import sys
-from typing import List
+import time
+import weakref
+from typing import List, Optional, Tuple
 
 import aiohttp
 import aiounifi
@@ -32,8 +36,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of device refreshes and delay (seconds) between them when verifying changes
+VERIFY_ATTEMPTS = 5
+VERIFY_INTERVAL = 0.4
+
+# Default Unix socket path and device refresh interval (seconds) for daemon mode
+DEFAULT_SOCKET_PATH = "/run/unifi_poe.sock"
+DAEMON_REFRESH_INTERVAL = 30
+
+# Seconds a fetched device list is reused before refreshing it from the controller
+DEVICE_CACHE_TTL = 15
+
+# Accepted spellings of the desired PoE state
+_ON_ALIASES = frozenset(('on', 'enable', 'enabled', 'true', '1'))
+_OFF_ALIASES = frozenset(('off', 'disable', 'disabled', 'false', '0'))
+
+# Translation table stripping MAC address separators
+_MAC_SEPARATORS = str.maketrans("", "", ":-")
+
+# Devices indexed by normalized MAC per controller, with the time they were fetched
+_device_cache: "weakref.WeakKeyDictionary[Controller, Tuple[float, dict]]" = weakref.WeakKeyDictionary()
+
+# Time of the last PoE change sent per controller; device lists fetched before it are not cached
+_device_cache_invalidated: "weakref.WeakKeyDictionary[Controller, float]" = weakref.WeakKeyDictionary()
+
+
+def _normalize_mac(mac: str) -> str:
+    """Normalize a MAC address (remove separators and convert to lowercase)."""
+    return mac.translate(_MAC_SEPARATORS).lower()
+
+
+def _parse_state(desired_state: str) -> str:
+    """Normalize a desired PoE state to 'on' or 'off'."""
+    state = desired_state.lower()
+    if state in _ON_ALIASES:
+        return 'on'
+    if state in _OFF_ALIASES:
+        return 'off'
+    raise ValueError(f"Invalid desired state: {desired_state}. Use 'on' or 'off'")
+
+
+def _index_devices(controller: Controller) -> dict:
+    """Index controller devices by normalized MAC address."""
+    return {_normalize_mac(device.mac): device for device in controller.devices.values()}
+
+
+def _invalidate_devices(controller: Controller):
+    """Drop the cached device list after a change so it is not reused in its old state."""
+    _device_cache.pop(controller, None)
+    _device_cache_invalidated[controller] = time.monotonic()
+
+
+async def get_devices_by_mac(controller: Controller, cache_ttl: float = DEVICE_CACHE_TTL) -> dict:
+    """Return controller devices by normalized MAC, refreshing them if older than cache_ttl seconds."""
+    cached = _device_cache.get(controller)
+    if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+        logger.debug("Using cached device list")
+        return cached[1]
+    
+    fetched_at = time.monotonic()
+    await controller.devices.update()
+    devices_by_mac = _index_devices(controller)
+    
+    # Don't cache a device list that may predate a change sent while it was being fetched
+    if fetched_at >= _device_cache_invalidated.get(controller, fetched_at):
+        _device_cache[controller] = (fetched_at, devices_by_mac)
+    return devices_by_mac
+
+
+def _index_ports(port_table: List[dict]) -> dict:
+    """Index a switch's port table by port index, skipping entries without one."""
+    return {port['port_idx']: port for port in port_table if 'port_idx' in port}
+
+
+def build_session(verify_ssl: bool = False) -> aiohttp.ClientSession:
+    """Create an aiohttp session suitable for talking to a UniFi controller.
+    
+    Library users driving several switches or repeated runs should create one
+    session and pass it to connect_to_controller() / main() so connections
+    are kept alive and reused across calls.
+    """
+    return aiohttp.ClientSession(
+        cookie_jar=aiohttp.CookieJar(unsafe=True),
+        connector=aiohttp.TCPConnector(
+            ssl=verify_ssl,
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300
+        )
+    )
+
 
 async def connect_to_controller(
+    session: aiohttp.ClientSession,
     host: str,
     username: str,
     password: str,
@@ -41,14 +138,9 @@ async def connect_to_controller(
     site: str = "default",
     verify_ssl: bool = False
 ) -> Controller:
-    """Connect to UniFi controller and return Controller instance."""
+    """Connect to UniFi controller using the given session and return Controller instance."""
     logger.info(f"Connecting to UniFi controller at {host}:{port}")
     
-    session = aiohttp.ClientSession(
-        cookie_jar=aiohttp.CookieJar(unsafe=True),
-        connector=aiohttp.TCPConnector(ssl=verify_ssl)
-    )
-    
     controller = Controller(
         Configuration(
             session,
@@ -76,84 +168,87 @@ async def connect_to_controller(
         raise
 
 
-async def find_switch_by_mac(controller: Controller, switch_mac: str):
+async def find_switch_by_mac(controller: Controller, switch_mac: str, cache_ttl: float = DEVICE_CACHE_TTL):
     """Find switch device by MAC address."""
+    # Update devices to get latest information unless fetched within cache_ttl
+    devices_by_mac = await get_devices_by_mac(controller, cache_ttl)
+    return _lookup_switch(devices_by_mac, switch_mac)
+
+
+def _lookup_switch(devices_by_mac: dict, switch_mac: str):
+    """Find switch device by MAC address in an index built by _index_devices()."""
     logger.info(f"Looking for switch with MAC: {switch_mac}")
     
-    # Update devices to get latest information
-    await controller.devices.update()
-    
-    # Normalize MAC address format (remove separators and convert to lowercase)
-    normalized_target_mac = switch_mac.replace(":", "").replace("-", "").lower()
+    device = devices_by_mac.get(_normalize_mac(switch_mac))
+    if device is None:
+        raise ValueError(f"Switch with MAC {switch_mac} not found")
     
-    for device in controller.devices.values():
-        device_mac = device.mac.replace(":", "").replace("-", "").lower()
-        if device_mac == normalized_target_mac:
-            logger.info(f"Found switch: {device.name} ({device.model})")
-            return device
-    
-    raise ValueError(f"Switch with MAC {switch_mac} not found")
+    logger.info(f"Found switch: {device.name} ({device.model})")
+    return device
 
 
 def get_current_poe_status(device, port_indexes: List[int]) -> dict:
     """Get current PoE status for specified ports."""
     port_status = {}
     
-    if not hasattr(device, 'port_table') or not device.port_table:
+    port_table = getattr(device, 'port_table', None)
+    if not port_table:
         raise ValueError("Device does not have port table (not a switch?)")
     
-    for port in device.port_table:
-        port_idx = port.get('port_idx')
-        if port_idx in port_indexes:
-            poe_mode = port.get('poe_mode', 'unknown')
-            poe_enable = port.get('poe_enable', False)
-            port_name = port.get('name', f"Port {port_idx}")
-            
-            port_status[port_idx] = {
-                'name': port_name,
-                'current_mode': poe_mode,
-                'poe_enable': poe_enable,
-                'poe_caps': port.get('poe_caps', 0)
-            }
+    ports_by_idx = _index_ports(port_table)
+    for port_idx in port_indexes:
+        port = ports_by_idx.get(port_idx)
+        if port is None:
+            continue
+        
+        poe_mode = port.get('poe_mode', 'unknown')
+        poe_enable = port.get('poe_enable', False)
+        port_name = port.get('name', f"Port {port_idx}")
+        
+        port_status[port_idx] = {
+            'name': port_name,
+            'current_mode': poe_mode,
+            'poe_enable': poe_enable,
+            'poe_caps': port.get('poe_caps', 0)
+        }
     
     return port_status
 
 
+def _port_needs_change(status: dict, target_state: str) -> bool:
+    """Check whether a port (as returned by get_current_poe_status()) supports PoE and is not in target_state."""
+    # Ports that do not support PoE cannot be changed
+    if status['poe_caps'] == 0:
+        return False
+    
+    current_state = 'off' if status['current_mode'] == 'off' else 'on'
+    return current_state != target_state
+
+
 def determine_set_actions(port_status: dict, desired_state: str) -> List[tuple]:
     """Determine what PoE mode to set for each port to achieve the desired state."""
     actions = []
     
     # Map desired state to PoE mode and action description
-    if desired_state.lower() in ['on', 'enable', 'enabled', 'true', '1']:
+    target_state = _parse_state(desired_state)
+    if target_state == 'on':
         target_mode = 'auto'
         action_desc = "enable"
-        target_state = 'on'
-    elif desired_state.lower() in ['off', 'disable', 'disabled', 'false', '0']:
+    else:
         target_mode = 'off'
         action_desc = "disable"
-        target_state = 'off'
-    else:
-        raise ValueError(f"Invalid desired state: {desired_state}. Use 'on' or 'off'")
     
     for port_idx, status in port_status.items():
         current_mode = status['current_mode']
-        poe_caps = status['poe_caps']
         
-        # Check if port supports PoE
-        if poe_caps == 0:
+        if _port_needs_change(status, target_state):
+            # Add action to change port to desired state
+            actions.append((port_idx, target_mode, action_desc))
+            logger.info(f"Will {action_desc} PoE on port {port_idx} ({status['name']}): {current_mode} -> {target_mode}")
+        elif status['poe_caps'] == 0:
             logger.warning(f"Port {port_idx} ({status['name']}) does not support PoE")
-            continue
-        
-        # Check if port is already in desired state
-        current_state = 'off' if current_mode == 'off' else 'on'
-        
-        if current_state == target_state:
+        else:
             logger.info(f"Port {port_idx} ({status['name']}) is already {target_state} ({current_mode})")
-            continue
-        
-        # Add action to change port to desired state
-        actions.append((port_idx, target_mode, action_desc))
-        logger.info(f"Will {action_desc} PoE on port {port_idx} ({status['name']}): {current_mode} -> {target_mode}")
     
     return actions
 
@@ -164,104 +259,266 @@ async def set_poe_ports(controller: Controller, device, actions: List[tuple]) ->
         logger.info("No PoE changes needed - all ports are already in the desired state")
         return True
     
+    return await _send_poe_request(controller, device, actions) is not None
+
+
+async def _send_poe_request(controller: Controller, device, actions: List[tuple]) -> Optional[dict]:
+    """Send the PoE mode request for actions and return the controller response, or None on failure."""
     try:
         # Create the request to set PoE modes
         targets = [(port_idx, mode) for port_idx, mode, _ in actions]
         request = DeviceSetPoePortModeRequest.create(device, targets=targets)
         
         logger.info(f"Sending PoE configuration request for {len(actions)} ports...")
-        response = await controller.request(request)
+        try:
+            response = await controller.request(request)
+        finally:
+            # The switch may have changed even if the request did not succeed
+            _invalidate_devices(controller)
         
         if response.get('meta', {}).get('rc') == 'ok':
             logger.info("PoE configuration request completed successfully")
-            return True
+            return response
         else:
             logger.error(f"PoE configuration request failed: {response}")
-            return False
+            return None
             
+    except aiounifi.LoginRequired:
+        # Let callers log in again and retry
+        raise
     except Exception as e:
         logger.error(f"Failed to set PoE: {e}")
-        return False
+        return None
 
 
-async def verify_changes(controller: Controller, device, original_status: dict, actions: List[tuple]):
-    """Verify that PoE configuration changes were applied successfully."""
-    logger.info("Verifying PoE configuration changes...")
-    
-    # Wait a moment for changes to propagate
-    await asyncio.sleep(2)
+def _ports_from_response(response: Optional[dict]) -> dict:
+    """Index the port table returned in a device request response by port index, if present."""
+    try:
+        return _index_ports(response['data'][0]['port_table'])
+    except (KeyError, IndexError, TypeError):
+        return {}
+
+
+def _ports_in_expected_mode(ports_by_idx: dict, action_dict: dict) -> bool:
+    """Check whether all modified ports report their expected PoE mode."""
+    return all(
+        ports_by_idx.get(port_idx, {}).get('poe_mode') == expected_mode
+        for port_idx, (expected_mode, _) in action_dict.items()
+    )
+
+
+async def verify_changes(controller: Controller, device, original_status: dict, actions: List[tuple],
+                         response: Optional[dict] = None):
+    """Verify that PoE configuration changes were applied successfully.
     
-    # Refresh device information
-    await controller.devices.update()
+    The port table in the set request's response is checked first; the device
+    list is only re-fetched if it is missing or does not show the changes yet.
+    """
+    logger.info("Verifying PoE configuration changes...")
     
-    # Get updated switch device
-    updated_device = None
-    for dev in controller.devices.values():
-        if dev.mac == device.mac:
-            updated_device = dev
-            break
+    action_dict = {port_idx: (new_mode, action) for port_idx, new_mode, action in actions}
+    ports_by_idx = _ports_from_response(response)
     
-    if not updated_device:
-        logger.error("Could not find updated device information")
-        return
+    if not _ports_in_expected_mode(ports_by_idx, action_dict):
+        target_mac = _normalize_mac(device.mac)
+        
+        # Poll device information until the modified ports report the expected modes
+        updated_device = None
+        for attempt in range(VERIFY_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(VERIFY_INTERVAL)
+            
+            # Always bypass the device cache since we want post-change state
+            found_device = (await get_devices_by_mac(controller, cache_ttl=0)).get(target_mac)
+            if found_device:
+                updated_device = found_device
+                ports_by_idx = _index_ports(updated_device.port_table)
+                if _ports_in_expected_mode(ports_by_idx, action_dict):
+                    break
+        
+        if not updated_device:
+            logger.error("Could not find updated device information")
+            return
     
     # Check each port that was modified
-    action_dict = {port_idx: (new_mode, action) for port_idx, new_mode, action in actions}
+    for port_idx, (expected_mode, action) in action_dict.items():
+        port = ports_by_idx.get(port_idx)
+        if port is None:
+            logger.warning(f"⚠ Port {port_idx}: Not found in updated port table")
+            continue
+        
+        current_mode = port.get('poe_mode', 'unknown')
+        port_name = port.get('name', f"Port {port_idx}")
+        
+        if current_mode == expected_mode:
+            logger.info(f"✓ Port {port_idx} ({port_name}): PoE {action}d successfully ({current_mode})")
+        else:
+            logger.warning(f"⚠ Port {port_idx} ({port_name}): Expected {expected_mode}, got {current_mode}")
+
+
+def _needs_changes(device, port_states: dict) -> bool:
+    """Check whether any PoE capable port of device is not yet in its desired state."""
+    if device is None or not getattr(device, 'port_table', None):
+        return False
     
-    for port in updated_device.port_table:
-        port_idx = port.get('port_idx')
-        if port_idx in action_dict:
-            current_mode = port.get('poe_mode', 'unknown')
-            expected_mode, action = action_dict[port_idx]
-            port_name = port.get('name', f"Port {port_idx}")
-            
-            if current_mode == expected_mode:
-                logger.info(f"✓ Port {port_idx} ({port_name}): PoE {action}d successfully ({current_mode})")
-            else:
-                logger.warning(f"⚠ Port {port_idx} ({port_name}): Expected {expected_mode}, got {current_mode}")
+    port_status = get_current_poe_status(device, list(port_states))
+    return any(
+        _port_needs_change(status, port_states[port_idx])
+        for port_idx, status in port_status.items()
+    )
 
 
-async def main(host: str, username: str, password: str, switch_mac: str, 
-               port_indexes: List[int], desired_state: str, port: int = 8443, 
-               site: str = "default", verify_ssl: bool = False, yes: bool = False):
-    """Main function to set PoE on specified switch ports to desired state."""
-    controller = None
-    session = None
-    try:
-        # Connect to controller
-        controller = await connect_to_controller(host, username, password, port, site, verify_ssl)
-        session = controller.connectivity.config.session
-        
-        # Find the switch
-        device = await find_switch_by_mac(controller, switch_mac)
+async def plan_poe_bulk(controller: Controller, specs: List[tuple],
+                        cache_ttl: float = DEVICE_CACHE_TTL) -> List[tuple]:
+    """Determine PoE changes for several switches at once.
+    
+    specs is a list of (switch_mac, port_indexes, desired_state) tuples. Specs
+    targeting the same switch are merged; for overlapping ports the later spec
+    wins. Returns one (device, current_status, actions) tuple per switch.
+    The device list is refreshed at most once, and not at all if it was
+    fetched within cache_ttl seconds and no changes are needed.
+    """
+    # Merge port states per switch
+    switches = {}
+    for switch_mac, port_indexes, desired_state in specs:
+        _, port_states = switches.setdefault(_normalize_mac(switch_mac), (switch_mac, {}))
+        for port_idx in port_indexes:
+            port_states[port_idx] = _parse_state(desired_state)
+    
+    # Refresh devices at most once for all switches
+    cached = _device_cache.get(controller)
+    devices_by_mac = await get_devices_by_mac(controller, cache_ttl)
+    
+    # Set requests rewrite a switch's port overrides from the device snapshot,
+    # so only build them from a cached device list if no changes are needed
+    if cached is not None and devices_by_mac is cached[1] and any(
+        _needs_changes(devices_by_mac.get(switch_key), port_states)
+        for switch_key, (_, port_states) in switches.items()
+    ):
+        devices_by_mac = await get_devices_by_mac(controller, cache_ttl=0)
+    
+    plans = []
+    for switch_mac, port_states in switches.values():
+        device = _lookup_switch(devices_by_mac, switch_mac)
         
         # Get current PoE status
-        current_status = get_current_poe_status(device, port_indexes)
+        current_status = get_current_poe_status(device, sorted(port_states))
         
         if not current_status:
-            logger.error("No valid ports found with the specified indexes")
-            return False
+            raise ValueError(f"No valid ports found with the specified indexes on switch {switch_mac}")
         
         logger.info(f"Current PoE status for {len(current_status)} ports:")
         for port_idx, status in current_status.items():
             logger.info(f"  Port {port_idx} ({status['name']}): {status['current_mode']}")
         
-        # Determine actions needed to reach desired state
-        actions = determine_set_actions(current_status, desired_state)
+        # Determine actions needed to reach desired state, grouped by state
+        ports_by_state = {}
+        for port_idx, desired_state in port_states.items():
+            if port_idx in current_status:
+                ports_by_state.setdefault(desired_state, {})[port_idx] = current_status[port_idx]
+        
+        actions = []
+        for desired_state, port_status in ports_by_state.items():
+            actions.extend(determine_set_actions(port_status, desired_state))
+        actions.sort()
+        
+        plans.append((device, current_status, actions))
+    
+    return plans
+
+
+async def apply_poe_bulk(controller: Controller, plans: List[tuple]) -> bool:
+    """Apply and verify planned PoE changes, with one request per switch sent concurrently."""
+    async def apply(device, current_status: dict, actions: List[tuple]) -> bool:
+        if not actions:
+            return await set_poe_ports(controller, device, actions)
+        
+        response = await _send_poe_request(controller, device, actions)
+        if response is None:
+            return False
+        
+        await verify_changes(controller, device, current_status, actions, response)
+        return True
+    
+    results = await asyncio.gather(*(apply(*plan) for plan in plans))
+    return all(results)
+
+
+async def set_poe_bulk(controller: Controller, specs: List[tuple],
+                       cache_ttl: float = DEVICE_CACHE_TTL) -> bool:
+    """Set PoE on ports across several switches without confirmation.
+    
+    See plan_poe_bulk() for the format of specs.
+    """
+    plans = await plan_poe_bulk(controller, specs, cache_ttl)
+    return await apply_poe_bulk(controller, plans)
+
+
+async def prompt_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    stdin is watched with an event loop reader rather than read in a worker
+    thread, so Ctrl-C at the prompt exits immediately instead of waiting for a line.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def read_line():
+        line = sys.stdin.readline()
+        if future.done():
+            return
+        if line:
+            future.set_result(line.rstrip('\n'))
+        else:
+            future.set_exception(EOFError())
+    
+    print(prompt, end='', flush=True)
+    try:
+        loop.add_reader(sys.stdin, read_line)
+    except (NotImplementedError, OSError):
+        # Event loop or stdin does not support readers (e.g. Windows, regular files)
+        return input()
+    
+    try:
+        return await future
+    finally:
+        loop.remove_reader(sys.stdin)
+
+
+async def main(host: str, username: str, password: str, switch_mac: str, 
+               port_indexes: List[int], desired_state: str, port: int = 8443, 
+               site: str = "default", verify_ssl: bool = False, yes: bool = False,
+               session: Optional[aiohttp.ClientSession] = None,
+               cache_ttl: float = DEVICE_CACHE_TTL):
+    """Main function to set PoE on specified switch ports to desired state.
+    
+    An existing aiohttp session may be passed in to reuse its connections;
+    it is left open for the caller. Otherwise a session is created and closed here.
+    """
+    owns_session = session is None
+    if owns_session:
+        session = build_session(verify_ssl)
+    try:
+        # Connect to controller
+        controller = await connect_to_controller(session, host, username, password, port, site, verify_ssl)
+        
+        # Find the switch and determine actions needed to reach desired state
+        plans = await plan_poe_bulk(controller, [(switch_mac, port_indexes, desired_state)], cache_ttl)
+        _, current_status, actions = plans[0]
         
         if not actions:
             logger.info(f"All specified ports are already in the desired state ({desired_state})")
             return True
         
         # Confirm actions with user (unless --yes flag is used)
-        state_desc = "enable" if desired_state.lower() in ['on', 'enable', 'enabled', 'true', '1'] else "disable"
+        state_desc = "enable" if _parse_state(desired_state) == 'on' else "disable"
         print(f"\nAbout to {state_desc} PoE on {len(actions)} ports:")
         for port_idx, new_mode, action in actions:
             port_name = current_status[port_idx]['name']
             print(f"  - {action.capitalize()} PoE on port {port_idx} ({port_name})")
         
         if not yes:
-            response = input("\nProceed? (y/N): ").strip().lower()
+            response = (await prompt_input("\nProceed? (y/N): ")).strip().lower()
             if response != 'y':
                 logger.info("Operation cancelled by user")
                 return False
@@ -269,12 +526,10 @@ async def main(host: str, username: str, password: str, switch_mac: str,
             print("\nProceeding automatically with --yes flag...")
             logger.info("Proceeding without confirmation due to --yes flag")
         
-        # Set PoE to desired state
-        success = await set_poe_ports(controller, device, actions)
+        # Set PoE to desired state and verify changes
+        success = await apply_poe_bulk(controller, plans)
         
         if success:
-            # Verify changes
-            await verify_changes(controller, device, current_status, actions)
             logger.info("PoE configuration operation completed")
             return True
         else:
@@ -285,10 +540,132 @@ async def main(host: str, username: str, password: str, switch_mac: str,
         logger.error(f"Error during PoE configuration operation: {e}")
         return False
     finally:
-        if session:
+        if owns_session:
             await session.close()
 
 
+async def refresh_devices_periodically(controller: Controller, interval: float = DAEMON_REFRESH_INTERVAL):
+    """Keep the controller's device list (and login session) fresh in the background."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await get_devices_by_mac(controller, cache_ttl=0)
+        except aiounifi.LoginRequired:
+            logger.info("Controller session expired - logging in again")
+            try:
+                await controller.login()
+                await get_devices_by_mac(controller, cache_ttl=0)
+            except Exception as e:
+                logger.error(f"Failed to log in to controller again: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to refresh devices: {e}")
+
+
+def parse_daemon_command(line: bytes) -> List[tuple]:
+    """Parse a JSON daemon command into a list of (switch_mac, port_indexes, desired_state) specs.
+    
+    A command is either a single {"mac", "ports", "state"} object or a list of them.
+    Ports may be given as a list of integers or as a port specification string.
+    """
+    try:
+        command = json.loads(line)
+        if isinstance(command, dict):
+            command = [command]
+        specs = []
+        for item in command:
+            ports = item['ports']
+            if isinstance(ports, str):
+                ports = parse_port_indexes(ports)
+            specs.append((item['mac'], [int(port_idx) for port_idx in ports], item['state']))
+        return specs
+    except (TypeError, KeyError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid command {line!r}: {e}")
+
+
+async def run_daemon(host: str, username: str, password: str, port: int = 443,
+                     site: str = "default", verify_ssl: bool = False,
+                     socket_path: str = DEFAULT_SOCKET_PATH, cache_ttl: float = DEVICE_CACHE_TTL):
+    """Stay connected to the controller and apply PoE commands received on a Unix socket.
+    
+    Each client sends one JSON command per line (see parse_daemon_command()) and
+    receives a JSON reply line of the form {"success": bool, "error": str|null}.
+    Changes are applied without confirmation, one command at a time.
+    """
+    session = build_session(verify_ssl)
+    try:
+        controller = await connect_to_controller(session, host, username, password, port, site, verify_ssl)
+        await get_devices_by_mac(controller, cache_ttl=0)
+        
+        # Set requests rewrite a switch's port overrides from the planned device
+        # snapshot, so commands must not plan while another is being applied
+        command_lock = asyncio.Lock()
+        
+        async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    
+                    reply = {'success': False, 'error': None}
+                    try:
+                        specs = parse_daemon_command(line)
+                        logger.info(f"Received command for {len(specs)} switch/port specs")
+                        async with command_lock:
+                            try:
+                                reply['success'] = await set_poe_bulk(controller, specs, cache_ttl)
+                            except aiounifi.LoginRequired:
+                                logger.info("Controller session expired - logging in again")
+                                await controller.login()
+                                reply['success'] = await set_poe_bulk(controller, specs, cache_ttl)
+                    except Exception as e:
+                        logger.error(f"Error during PoE configuration operation: {e}")
+                        reply['error'] = str(e)
+                    
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+            finally:
+                writer.close()
+                await writer.wait_closed()
+        
+        refresh_task = asyncio.create_task(refresh_devices_periodically(controller))
+        server = await asyncio.start_unix_server(handle_client, path=socket_path)
+        logger.info(f"Listening for PoE commands on {socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            refresh_task.cancel()
+            try:
+                os.unlink(socket_path)
+            except FileNotFoundError:
+                pass
+    finally:
+        await session.close()
+
+
+async def run_client(switch_mac: str, port_indexes: List[int], desired_state: str,
+                     socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """Send a PoE command to a running daemon and report its result."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        command = {'mac': switch_mac, 'ports': port_indexes, 'state': desired_state}
+        writer.write(json.dumps(command).encode() + b"\n")
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    
+    if reply.get('error'):
+        logger.error(f"Daemon reported an error: {reply['error']}")
+    elif reply.get('success'):
+        logger.info("PoE configuration operation completed")
+    else:
+        logger.error("PoE configuration operation failed")
+    return bool(reply.get('success'))
+
+
 def parse_port_indexes(port_string: str) -> List[int]:
     """Parse comma-separated port indexes into a list of integers."""
     try:
@@ -302,12 +679,54 @@ def parse_port_indexes(port_string: str) -> List[int]:
             else:
                 # Handle individual ports
                 ports.append(int(part))
-        return sorted(list(set(ports)))  # Remove duplicates and sort
+        return sorted(set(ports))  # Remove duplicates and sort
     except ValueError as e:
         raise ValueError(f"Invalid port specification '{port_string}': {e}")
 
 
+def run_client_cli(argv: List[str]):
+    """Parse --client arguments (which take no controller credentials) and send the command to the daemon."""
+    parser = argparse.ArgumentParser(
+        description="Send a PoE command to a running daemon (applied without confirmation)",
+        usage="%(prog)s --client switch_mac ports --state {on,off,enable,disable} [--socket SOCKET] [--debug]"
+    )
+    parser.add_argument("--client", action="store_true", required=True, help=argparse.SUPPRESS)
+    parser.add_argument("switch_mac", help="MAC address of the switch")
+    parser.add_argument("ports", help="Port indexes to configure (comma-separated, ranges supported)")
+    parser.add_argument("--state", required=True, choices=['on', 'off', 'enable', 'disable'], 
+                       help="Desired PoE state (on/enable or off/disable)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH,
+                        help=f"Unix socket path of the daemon (default: {DEFAULT_SOCKET_PATH})")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    
+    args = parser.parse_args(argv)
+    
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    try:
+        port_indexes = parse_port_indexes(args.ports)
+        logger.info(f"Target ports: {port_indexes}")
+    except ValueError as e:
+        logger.error(f"Error parsing port indexes: {e}")
+        sys.exit(1)
+    
+    try:
+        success = asyncio.run(run_client(args.switch_mac, port_indexes, args.state, args.socket))
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("Operation cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
+    # Client mode talks only to the daemon, so it takes no controller credentials
+    if "--client" in sys.argv[1:]:
+        run_client_cli(sys.argv[1:])
+    
     parser = argparse.ArgumentParser(
         description="Set PoE status on UniFi switch ports to desired state",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -317,27 +736,64 @@ Examples:
   %(prog)s 192.168.1.1 admin password 00:11:22:33:44:55 1-8 --state off --port 443
   %(prog)s unifi.local admin password aa:bb:cc:dd:ee:ff 5,10-12 --state enable --site main
   %(prog)s 192.168.1.1 admin password 00:11:22:33:44:55 1,2,3 --state off --yes  # For automation
+  %(prog)s 192.168.1.1 admin password --daemon  # Keep a controller session warm
+  %(prog)s --client 00:11:22:33:44:55 1,2,3 --state off  # Send to a running daemon
         """
     )
     
     parser.add_argument("host", help="UniFi controller hostname or IP")
     parser.add_argument("username", help="Username for UniFi controller")
     parser.add_argument("password", help="Password for UniFi controller")
-    parser.add_argument("switch_mac", help="MAC address of the switch")
-    parser.add_argument("ports", help="Port indexes to configure (comma-separated, ranges supported)")
-    parser.add_argument("--state", required=True, choices=['on', 'off', 'enable', 'disable'], 
+    parser.add_argument("switch_mac", nargs="?", help="MAC address of the switch")
+    parser.add_argument("ports", nargs="?", help="Port indexes to configure (comma-separated, ranges supported)")
+    parser.add_argument("--state", choices=['on', 'off', 'enable', 'disable'], 
                        help="Desired PoE state (on/enable or off/disable)")
     parser.add_argument("--port", type=int, default=443, help="Controller port (default: 443)")
     parser.add_argument("--site", default="default", help="Site name (default: default)")
     parser.add_argument("--verify-ssl", action="store_true", help="Verify SSL certificates")
     parser.add_argument("--yes", action="store_true", help="Skip confirmation prompt (for automation)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Stay connected and accept PoE commands on a Unix socket")
+    parser.add_argument("--client", action="store_true",
+                        help="Send a PoE command to a running daemon instead, without credentials "
+                             "(see %(prog)s --client --help)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH,
+                        help=f"Unix socket path for --daemon/--client (default: {DEFAULT_SOCKET_PATH})")
+    parser.add_argument("--cache-ttl", type=float,
+                        help=f"With --daemon: seconds a fetched device list is reused (default: {DEVICE_CACHE_TTL})")
     
     args = parser.parse_args()
     
+    # The device cache only outlives a single operation in the long-running daemon
+    if args.cache_ttl is not None and not args.daemon:
+        parser.error("--cache-ttl only applies with --daemon")
+    
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.daemon:
+        try:
+            asyncio.run(run_daemon(
+                args.host,
+                args.username,
+                args.password,
+                args.port,
+                args.site,
+                args.verify_ssl,
+                args.socket,
+                DEVICE_CACHE_TTL if args.cache_ttl is None else args.cache_ttl
+            ))
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped")
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+    
+    if args.switch_mac is None or args.ports is None or args.state is None:
+        parser.error("switch_mac, ports and --state are required unless running with --daemon")
+    
     try:
         port_indexes = parse_port_indexes(args.ports)
         logger.info(f"Target ports: {port_indexes}")